@@ -39,6 +39,17 @@ except ImportError:
         RLHF_AVAILABLE = False
     )
 import json
+from concurrent.futures import ThreadPoolExecutor
+
+# Phase 3 external research routing: (tool, result label, trigger keywords, icon, log name)
+EXTERNAL_RESEARCH_ROUTES = [
+    ("web_search", "Web Search", ['search', 'find', 'information', 'about'], "🌐", "Web search"),
+    ("wikipedia_search", "Wikipedia", ['background', 'definition', 'what is', 'explain'], "📚", "Wikipedia search"),
+    ("arxiv_search", "arXiv", ['research', 'academic', 'study', 'paper', 'scientific'], "🎓", "arXiv search"),
+    ("news_search", "News", ['recent', 'current', 'latest', 'news', 'developments'], "📰", "News search"),
+]
+# Upper bound on concurrent external tool calls per research step
+MAX_PARALLEL_TOOL_CALLS = 8
 
 class AgentState(TypedDict):
     """State for the research agent - Enhanced for Phase 6 RLHF"""
@@ -299,58 +310,13 @@ class ResearchAgent:
         })
         
         # Phase 3: Execute external research based on step content
-        external_research_results = []
-        
         # Intelligent tool selection based on research step
         step_lower = current_step.lower()
-        
-        # Web search for general information
-        if any(keyword in step_lower for keyword in ['search', 'find', 'information', 'about']):
-            try:
-                web_result = self.tool_executor.invoke({
-                    "tool": "web_search",
-                    "tool_input": current_step
-                })
-                external_research_results.append(f"Web Search: {web_result}")
-                print("🌐 Web search completed")
-            except Exception as e:
-                print(f"⚠️ Web search failed: {e}")
-        
-        # Wikipedia for background/definitions
-        if any(keyword in step_lower for keyword in ['background', 'definition', 'what is', 'explain']):
-            try:
-                wiki_result = self.tool_executor.invoke({
-                    "tool": "wikipedia_search",
-                    "tool_input": current_step
-                })
-                external_research_results.append(f"Wikipedia: {wiki_result}")
-                print("📚 Wikipedia search completed")
-            except Exception as e:
-                print(f"⚠️ Wikipedia search failed: {e}")
-        
-        # arXiv for academic/research content
-        if any(keyword in step_lower for keyword in ['research', 'academic', 'study', 'paper', 'scientific']):
-            try:
-                arxiv_result = self.tool_executor.invoke({
-                    "tool": "arxiv_search",
-                    "tool_input": current_step
-                })
-                external_research_results.append(f"arXiv: {arxiv_result}")
-                print("🎓 arXiv search completed")
-            except Exception as e:
-                print(f"⚠️ arXiv search failed: {e}")
-        
-        # News search for current/recent information
-        if any(keyword in step_lower for keyword in ['recent', 'current', 'latest', 'news', 'developments']):
-            try:
-                news_result = self.tool_executor.invoke({
-                    "tool": "news_search",
-                    "tool_input": current_step
-                })
-                external_research_results.append(f"News: {news_result}")
-                print("📰 News search completed")
-            except Exception as e:
-                print(f"⚠️ News search failed: {e}")
+        selected_routes = [
+            route for route in EXTERNAL_RESEARCH_ROUTES
+            if any(keyword in step_lower for keyword in route[2])
+        ]
+        external_research_results = self._run_external_research(current_step, selected_routes)
         
         # Comprehensive analysis with all sources
         analysis_prompt = f"""
@@ -422,6 +388,31 @@ class ResearchAgent:
         
         return state
     
+    def _run_external_research(self, current_step: str, routes: List[tuple]) -> List[str]:
+        """Run the selected external research tools concurrently, preserving route order"""
+        if not routes:
+            return []
+        
+        def run_route(route):
+            tool_name, label, _, icon, log_name = route
+            try:
+                result = self.tool_executor.invoke({
+                    "tool": tool_name,
+                    "tool_input": current_step
+                })
+                print(f"{icon} {log_name} completed")
+                return f"{label}: {result}"
+            except Exception as e:
+                print(f"⚠️ {log_name} failed: {e}")
+                return None
+        
+        # The lookups are independent and I/O-bound, so step latency is bounded
+        # by the slowest source instead of the sum of all of them
+        with ThreadPoolExecutor(max_workers=min(MAX_PARALLEL_TOOL_CALLS, len(routes))) as pool:
+            results = list(pool.map(run_route, routes))
+        
+        return [result for result in results if result is not None]
+    
     def intelligence_analysis(self, state: AgentState) -> AgentState:
         """Phase 4: Multi-agent intelligence analysis and hypothesis generation"""
         print("🧠 Starting Intelligence Layer Analysis...")
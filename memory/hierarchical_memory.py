@@ -234,7 +234,9 @@ class HierarchicalMemory:
     def get_memory_statistics(self) -> Dict[str, Any]:
         """Get comprehensive memory system statistics"""
         
-        now = datetime.now()
+        # (now - start_time).days <= 7 holds exactly when start_time > now - 8 days,
+        # so episodes can be counted with one comparison each
+        recent_cutoff = datetime.now() - timedelta(days=8)
         
         return {
             "short_term_count": len(self.short_term_memory),
@@ -244,8 +246,8 @@ class HierarchicalMemory:
             "knowledge_graph_edges": self.knowledge_graph.number_of_edges(),
             "concepts_tracked": len(self.concept_index),
             "citations_tracked": len(self.citation_index),
-            "recent_episodes": len([e for e in self.episodic_memory.values() 
-                                  if (now - e.start_time).days <= 7]),
+            "recent_episodes": sum(1 for e in self.episodic_memory.values()
+                                   if e.start_time > recent_cutoff),
             "memory_utilization": len(self.short_term_memory) / self.short_term_capacity
         }
     
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""
+Test script for the web interfaces' result caching
+Verifies answer caching, request coalescing and the research archive
+using a fake research graph, so no LLM or network access is needed
+"""
+
+import asyncio
+import gc
+import os
+from unittest.mock import patch
+
+from ui import gradio_app
+from ui import streamlit_app
+
+class FakeResearchAgent:
+    """Stand-in for the compiled research graph that streams two state snapshots"""
+    
+    def __init__(self, runs: list, fail: bool = False, delay: float = 0.05):
+        self.runs = runs
+        self.fail = fail
+        self.delay = delay
+    
+    async def astream(self, initial_state, stream_mode="values"):
+        self.runs.append(initial_state["research_question"])
+        await asyncio.sleep(self.delay)
+        if self.fail:
+            raise RuntimeError("simulated research failure")
+        
+        yield {**initial_state, "research_plan": ["Step 1"]}
+        await asyncio.sleep(self.delay)
+        yield {
+            **initial_state,
+            "research_plan": ["Step 1"],
+            "findings": [{"step": 0, "step_description": "Step 1", "analysis": "done"}],
+            "final_answer": f"Answer to: {initial_state['research_question']}"
+        }
+
+def install_fake_agents(fail: bool = False) -> list:
+    """Fill the shared agent pool with fake graphs; returns the list of questions they run"""
+    runs = []
+    gradio_app._agent_pool.clear()
+    gradio_app._agent_pool.extend(
+        FakeResearchAgent(runs, fail=fail) for _ in range(gradio_app._RESEARCH_WORKERS)
+    )
+    return runs
+
+async def collect_outputs(interface, question: str) -> list:
+    """Run conduct_research to completion and return everything it yielded"""
+    return [outputs async for outputs in interface.conduct_research(question)]
+
+def test_answer_cache():
+    """Test that repeated questions hit the cache until the TTL expires"""
+    print("\n1. Testing Answer Cache Hit and TTL Expiry...")
+    
+    try:
+        runs = install_fake_agents()
+        interface = gradio_app.GradioResearchInterface()
+        
+        async def scenario():
+            first = await collect_outputs(interface, "What is AI?")
+            assert len(runs) == 1, f"expected one run, got {len(runs)}"
+            assert first[-1][0] == "Answer to: What is AI?"
+            
+            # Same question, different spelling: served from cache in a single update
+            repeat = await collect_outputs(interface, "  what is ai?  ")
+            assert len(runs) == 1, "cache hit should not run the graph again"
+            assert repeat == [first[-1]]
+            print("✅ Repeated question served from cache")
+            
+            with patch.object(gradio_app, "_ANSWER_CACHE_TTL_SECONDS", 0):
+                assert interface._get_cached_answer("what is ai?") is None
+            assert "what is ai?" not in interface._answer_cache, "expired entry should be dropped"
+            
+            await collect_outputs(interface, "What is AI?")
+            assert len(runs) == 2, "expired entry should trigger a new run"
+            print("✅ Expired cache entry triggers a new run")
+        
+        asyncio.run(scenario())
+        return True
+    
+    except Exception as e:
+        print(f"❌ Answer cache test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_answer_cache_eviction():
+    """Test LRU eviction once the answer cache is full"""
+    print("\n2. Testing Answer Cache LRU Eviction...")
+    
+    try:
+        interface = gradio_app.GradioResearchInterface()
+        outputs = ("answer", "process", "intelligence", "quality")
+        
+        for i in range(gradio_app._ANSWER_CACHE_SIZE):
+            interface._cache_answer(f"question {i}", outputs)
+        
+        # Touch the oldest entry so the second oldest becomes least recently used
+        assert interface._get_cached_answer("question 0") == outputs
+        interface._cache_answer("one more question", outputs)
+        
+        assert len(interface._answer_cache) == gradio_app._ANSWER_CACHE_SIZE
+        assert "question 1" not in interface._answer_cache, "least recently used entry should be evicted"
+        assert "question 0" in interface._answer_cache, "recently used entry should be kept"
+        assert "one more question" in interface._answer_cache
+        print(f"✅ Cache stays at {gradio_app._ANSWER_CACHE_SIZE} entries, evicting the least recently used")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Answer cache eviction test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_request_coalescing():
+    """Test that concurrent identical questions share a single research run"""
+    print("\n3. Testing Concurrent Request Coalescing...")
+    
+    try:
+        runs = install_fake_agents()
+        interface = gradio_app.GradioResearchInterface()
+        
+        async def scenario():
+            return await asyncio.gather(
+                collect_outputs(interface, "How do vaccines work?"),
+                collect_outputs(interface, "how do vaccines work?")
+            )
+        
+        starter, follower = asyncio.run(scenario())
+        
+        assert len(runs) == 1, f"expected one run, got {len(runs)}"
+        assert starter[-1] == follower[-1], "both callers should get the same result"
+        assert starter[-1][0] == "Answer to: How do vaccines work?"
+        assert [outputs[0] for outputs in starter].count(starter[-1][0]) == 1, "final answer sent twice"
+        assert not interface._pending_research, "finished runs should leave the pending map"
+        print("✅ Two identical concurrent questions produced a single run")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Request coalescing test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def test_failed_runs_not_cached():
+    """Test that a failed run reports the error and is not cached"""
+    print("\n4. Testing Failed Runs Are Not Cached...")
+    
+    try:
+        install_fake_agents(fail=True)
+        interface = gradio_app.GradioResearchInterface()
+        
+        async def scenario():
+            outputs = await collect_outputs(interface, "Why is the sky blue?")
+            assert outputs[-1][0].startswith("Research failed"), outputs[-1][0]
+            assert not interface._answer_cache, "failed run should not be cached"
+            assert not interface._pending_research
+            assert not interface.research_history
+            print("✅ Failure reported and nothing cached")
+            
+            runs = install_fake_agents()
+            outputs = await collect_outputs(interface, "Why is the sky blue?")
+            assert len(runs) == 1, "question should be researched again after a failure"
+            assert outputs[-1][0] == "Answer to: Why is the sky blue?"
+            print("✅ Same question runs again after a failure")
+        
+        asyncio.run(scenario())
+        return True
+    
+    except Exception as e:
+        print(f"❌ Failed run caching test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+class FakeSessionState(dict):
+    """Attribute-style dict standing in for st.session_state outside a Streamlit run"""
+    __getattr__ = dict.__getitem__
+    __setattr__ = dict.__setitem__
+
+def test_research_archive():
+    """Test archive spill, reload and eviction of Streamlit research records"""
+    print("\n5. Testing Research Archive Round-Trip and Eviction...")
+    
+    try:
+        session_state = FakeSessionState()
+        with patch.object(streamlit_app.st, "session_state", session_state):
+            interface = streamlit_app.StreamlitResearchInterface()
+            history_limit = streamlit_app._HISTORY_LIMIT
+            archive_limit = streamlit_app._ARCHIVE_LIMIT
+            archive_dir = session_state.archive_dir
+            
+            def make_record(i):
+                return {
+                    'question': f"Question {i}",
+                    'result': {'final_answer': f"Answer {i}", 'findings': [{'step': i}]},
+                    'timestamp': f"2025-01-01T00:00:{i:02d}"
+                }
+            
+            # One past the history limit spills the oldest record to disk
+            for i in range(history_limit + 1):
+                interface.store_research_record(make_record(i))
+            
+            archived = session_state.archived_research
+            assert len(session_state.research_history) == history_limit
+            assert len(archived) == 1
+            first_stub = archived[0]
+            assert os.path.exists(first_stub['path'])
+            assert streamlit_app._load_archived_record(first_stub) == make_record(0)
+            print("✅ Archived record reloads unchanged")
+            
+            # Fill the archive past its limit; the oldest stubs and their files go
+            for i in range(history_limit + 1, history_limit + archive_limit + 2):
+                interface.store_research_record(make_record(i))
+            
+            assert len(archived) == archive_limit
+            assert first_stub not in archived
+            assert not os.path.exists(first_stub['path']), "evicted record's file should be deleted"
+            assert len(os.listdir(archive_dir)) == archive_limit
+            print(f"✅ Archive capped at {archive_limit} records, evicted files deleted")
+            
+            del interface, archived, first_stub
+        
+        # Dropping the session state removes the session's archive directory
+        session_state.clear()
+        gc.collect()
+        assert not os.path.exists(archive_dir), "session archive should be removed with the session"
+        print("✅ Session archive directory removed with the session")
+        return True
+    
+    except Exception as e:
+        print(f"❌ Research archive test failed: {e}")
+        import traceback
+        traceback.print_exc()
+        return False
+
+def main():
+    """Run all caching tests"""
+    print("🧪 Testing Web Interface Caching")
+    print("=" * 50)
+    
+    results = [
+        test_answer_cache(),
+        test_answer_cache_eviction(),
+        test_request_coalescing(),
+        test_failed_runs_not_cached(),
+        test_research_archive()
+    ]
+    
+    print("\n" + "=" * 50)
+    if all(results):
+        print("🎉 All caching tests passed!")
+    else:
+        print(f"❌ {results.count(False)} of {len(results)} caching tests failed. Check the error messages above.")
+
+if __name__ == "__main__":
+    main()
@@ -5,12 +5,14 @@ Alternative web interface with focus on simplicity and sharing
 """
 
 import gradio as gr
-import json
+import asyncio
+import functools
+import string
 import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List, Tuple
-import plotly.graph_objects as go
-import plotly.express as px
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional, Tuple, Union
 
 # Import our research agent
 import sys
@@ -20,135 +22,357 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from agent.research_agent import create_agent
 from memory.advanced_memory_manager import AdvancedMemoryManager
 
+# Number of research records kept for the history tab
+_HISTORY_LIMIT = 50
+# Seconds a rendered memory statistics panel is reused before recomputing
+_STATS_TTL_SECONDS = 5.0
+# Answers to repeated questions are served from cache (LRU size, TTL in seconds)
+_ANSWER_CACHE_SIZE = 128
+_ANSWER_CACHE_TTL_SECONDS = 3600
+# Research runs go through a bounded queue drained by a fixed worker pool
+_RESEARCH_WORKERS = 4
+_RESEARCH_QUEUE_SIZE = 64
+# Gradio event queue: handlers allowed to run concurrently, and pending events
+_EVENT_CONCURRENCY = 8
+_EVENT_QUEUE_SIZE = 64
+
+# Research question suggestions (static, so the markdown is rendered once)
+_SUGGESTIONS = (
+    "What are the ethical implications of AI in healthcare?",
+    "How do different renewable energy technologies compare in efficiency?",
+    "What are the latest breakthroughs in quantum computing?",
+    "How does climate change affect global food security?",
+    "What are the emerging trends in cybersecurity?",
+    "How do different economic models predict inflation?",
+    "What are the competing theories about consciousness?",
+    "How does social media impact mental health?",
+    "What are the potential applications of CRISPR gene editing?",
+    "How do neural networks learn and make decisions?"
+)
+_SUGGESTIONS_MD = "## Research Question Suggestions\n\n" + "".join(
+    f"{i}. {suggestion}\n" for i, suggestion in enumerate(_SUGGESTIONS, 1)
+)
+
+# Export report pieces; the sections in between are the rendered result tabs
+_EXPORT_HEADER = string.Template("""# AI Research Agent - Research Report
+
+Generated on: $generated_on
+
+## Final Answer
+
+$final_answer
+
+""")
+_EXPORT_FOOTER = """
+
+---
+
+*This report was generated by the AI Research Agent - Phase 5 User Experience*
+"""
+
+_QUALITY_ICONS = {True: "✅", False: "❌"}
+
+# Status lines shown in the answer box while a run is queued or in progress
+_QUEUED_MESSAGE = "⏳ Research queued..."
+_PLANNING_MESSAGE = "📋 Creating research plan..."
+_STEP_MESSAGE_PREFIX = "🔍 Researching step "
+_SYNTHESIS_MESSAGE = "🧠 Running intelligence analysis and synthesis..."
+# Answer box contents that are not research results and must not be exported
+_NOT_EXPORTABLE_PREFIXES = (
+    "Please enter", "Research failed",
+    _QUEUED_MESSAGE, _PLANNING_MESSAGE, _STEP_MESSAGE_PREFIX, _SYNTHESIS_MESSAGE
+)
+
+@functools.lru_cache(maxsize=64)
+def _pretty_indicator(indicator: str) -> str:
+    """Display name for a quality indicator key, e.g. 'well_sourced' -> 'Well Sourced'"""
+    return indicator.replace('_', ' ').title()
+
+@dataclass(slots=True, frozen=True)
+class ResearchRecord:
+    """Compact entry in the research history tab"""
+    question: str
+    timestamp: str
+    quality_score: Union[float, str]
+
+def _format_results(result: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Render agent state as the final answer, process, intelligence and quality tabs"""
+    
+    # Read each section of the agent state once, then build all four views
+    final_answer = result.get("final_answer", "No final answer generated")
+    research_plan = result.get("research_plan", [])
+    findings = result.get("findings", [])
+    multi_agent_analysis = result.get("multi_agent_analysis", {})
+    hypotheses = result.get("hypotheses", [])
+    quality_assessment = result.get("quality_assessment", {})
+    
+    # Research process summary
+    # The agent's quality assessment already counts findings with external research
+    external_count = quality_assessment.get("external_sources_used")
+    if external_count is None:
+        external_count = len([f for f in findings if f.get('external_research')])
+    
+    plan_lines = [f"{i}. {step}" for i, step in enumerate(research_plan, 1)]
+    process_summary = "\n".join([
+        "## Research Process",
+        "",
+        "### Research Plan:",
+        *plan_lines,
+        "",
+        "### Findings Summary:",
+        f"- Total research steps completed: {len(findings)}",
+        f"- External sources consulted: {external_count}",
+        ""
+    ])
+    
+    # Intelligence analysis summary
+    intelligence_lines = ["## Intelligence Analysis", ""]
+    
+    # Multi-agent analysis
+    if multi_agent_analysis:
+        confidence_scores = multi_agent_analysis.get("confidence_scores", {})
+        intelligence_lines += [
+            "### Multi-Agent Collaboration:",
+            f"- Researcher Confidence: {confidence_scores.get('researcher_avg', 0):.2f}",
+            f"- Critic Confidence: {confidence_scores.get('critic_avg', 0):.2f}",
+            f"- Synthesizer Confidence: {confidence_scores.get('synthesis_confidence', 0):.2f}"
+        ]
+    
+    # Hypotheses
+    if hypotheses:
+        intelligence_lines += ["", "### Generated Hypotheses:"]
+        intelligence_lines += [
+            line
+            for i, hyp in enumerate(hypotheses, 1)
+            for line in (
+                f"{i}. **{hyp['statement']}**",
+                f"   - Type: {hyp['type']}",
+                f"   - Confidence: {hyp['confidence']:.2f}",
+                ""
+            )
+        ]
+    
+    intelligence_summary = "\n".join(intelligence_lines) + "\n"
+    
+    # Quality assessment
+    quality_lines = ["## Quality Assessment", ""]
+    
+    if quality_assessment:
+        quality_indicators = quality_assessment.get("quality_indicators", {})
+        quality_lines += [
+            f"- **Overall Quality Score:** {quality_assessment.get('overall_quality_score', 'N/A')}/10",
+            f"- **Confidence Level:** {quality_assessment.get('confidence_assessment', 'N/A'):.2f}",
+            f"- **Total Findings:** {quality_assessment.get('total_findings', 0)}",
+            f"- **External Sources Used:** {quality_assessment.get('external_sources_used', 0)}",
+            f"- **Source Diversity:** {quality_assessment.get('source_diversity', 0)}",
+            "",
+            "### Quality Indicators:"
+        ]
+        quality_lines += [
+            f"{_QUALITY_ICONS[bool(status)]} {_pretty_indicator(indicator)}"
+            for indicator, status in quality_indicators.items()
+        ]
+    
+    quality_summary = "\n".join(quality_lines) + "\n"
+    
+    return final_answer, process_summary, intelligence_summary, quality_summary
+
+def _format_progress(state: Dict[str, Any]) -> Tuple[str, str, str, str]:
+    """Render a partial agent state, with a status line in place of the final answer"""
+    final_answer, process_summary, intelligence_summary, quality_summary = _format_results(state)
+    
+    if not state.get("final_answer"):
+        research_plan = state.get("research_plan", [])
+        completed_steps = len(state.get("findings", []))
+        if not research_plan:
+            final_answer = _PLANNING_MESSAGE
+        elif completed_steps < len(research_plan):
+            final_answer = f"{_STEP_MESSAGE_PREFIX}{completed_steps + 1} of {len(research_plan)}..."
+        else:
+            final_answer = _SYNTHESIS_MESSAGE
+    
+    return final_answer, process_summary, intelligence_summary, quality_summary
+
+# Compiled research graphs shared by every interface. A run checks one out and
+# returns it when done, so no two concurrent runs ever use the same graph
+_agent_pool: deque = deque()
+
+async def _checkout_agent():
+    """Take an idle compiled graph from the pool, building one if none is free"""
+    try:
+        return _agent_pool.pop()
+    except IndexError:
+        # Graph construction is blocking; keep it off the event loop
+        return await asyncio.to_thread(create_agent)
+
 class GradioResearchInterface:
     """Gradio interface for the research agent"""
     
     def __init__(self):
-        self.agent = None
-        self.memory_manager = AdvancedMemoryManager()
-        self.research_history = []
+        self._memory_manager = None
+        self.research_history = deque(maxlen=_HISTORY_LIMIT)
+        self._stats_cache: Optional[Tuple[float, str]] = None
+        self._answer_cache: OrderedDict = OrderedDict()
+        self._pending_research: Dict[str, asyncio.Future] = {}
+        self._research_queue: Optional[asyncio.Queue] = None
+        self._research_workers: List[asyncio.Task] = []
     
-    def initialize_agent(self):
-        """Initialize the research agent"""
-        if self.agent is None:
-            self.agent = create_agent()
-        return self.agent
+    @property
+    def memory_manager(self) -> AdvancedMemoryManager:
+        """Memory manager, created on first use by the memory statistics panel"""
+        if self._memory_manager is None:
+            self._memory_manager = AdvancedMemoryManager()
+        return self._memory_manager
     
-    def conduct_research(self, question: str, enable_hypothesis: bool = True, 
-                        enable_multi_agent: bool = True) -> Tuple[str, str, str, str]:
-        """Conduct research and return results"""
+    async def conduct_research(self, question: str, enable_hypothesis: bool = True, 
+                              enable_multi_agent: bool = True) -> AsyncIterator[Tuple[str, str, str, str]]:
+        """Conduct research, yielding partial results as each phase completes"""
         
         if not question.strip():
-            return "Please enter a research question.", "", "", ""
+            yield "Please enter a research question.", "", "", ""
+            return
+        
+        question_key = question.strip().lower()
+        cached = self._get_cached_answer(question_key)
+        if cached is not None:
+            yield cached
+            return
+        
+        # Coalesce concurrent submissions of the same question onto one run;
+        # only the caller that started it streams progress
+        updates = None
+        task = self._pending_research.get(question_key)
+        if task is None:
+            updates = asyncio.Queue()
+            task = asyncio.ensure_future(
+                self._run_research(question, question_key, updates.put_nowait)
+            )
+            self._pending_research[question_key] = task
+            task.add_done_callback(lambda _: self._pending_research.pop(question_key, None))
+            task.add_done_callback(lambda _: updates.put_nowait(None))
         
         try:
-            # Initialize agent
-            agent = self.initialize_agent()
-            
-            # Prepare initial state
-            initial_state = {
-                "messages": [],
-                "research_question": question,
-                "research_plan": [],
-                "current_step": 0,
-                "findings": [],
-                "final_answer": "",
-                "iteration_count": 0,
-                "hypotheses": [],
-                "multi_agent_analysis": {},
-                "quality_assessment": {},
-                "intelligence_insights": {}
-            }
+            yield _QUEUED_MESSAGE, "", "", ""
             
-            # Execute research
-            result = agent.invoke(initial_state)
+            last_yielded = None
+            if updates is not None:
+                while (snapshot := await updates.get()) is not None:
+                    last_yielded = _format_progress(snapshot)
+                    yield last_yielded
             
-            # Store in history
-            research_record = {
-                'question': question,
-                'result': result,
-                'timestamp': datetime.now().isoformat(),
-                'quality_score': result.get('quality_assessment', {}).get('overall_quality_score', 'N/A')
-            }
-            self.research_history.append(research_record)
-            
-            # Format results for display
-            final_answer = result.get("final_answer", "No final answer generated")
-            
-            # Research process summary
-            research_plan = result.get("research_plan", [])
-            findings = result.get("findings", [])
-            
-            process_summary = "## Research Process\n\n"
-            process_summary += "### Research Plan:\n"
-            for i, step in enumerate(research_plan, 1):
-                process_summary += f"{i}. {step}\n"
-            
-            process_summary += f"\n### Findings Summary:\n"
-            process_summary += f"- Total research steps completed: {len(findings)}\n"
-            process_summary += f"- External sources consulted: {sum(1 for f in findings if f.get('external_research'))}\n"
-            
-            # Intelligence analysis summary
-            intelligence_summary = "## Intelligence Analysis\n\n"
-            
-            # Multi-agent analysis
-            multi_agent_analysis = result.get("multi_agent_analysis", {})
-            if multi_agent_analysis:
-                confidence_scores = multi_agent_analysis.get("confidence_scores", {})
-                intelligence_summary += "### Multi-Agent Collaboration:\n"
-                intelligence_summary += f"- Researcher Confidence: {confidence_scores.get('researcher_avg', 0):.2f}\n"
-                intelligence_summary += f"- Critic Confidence: {confidence_scores.get('critic_avg', 0):.2f}\n"
-                intelligence_summary += f"- Synthesizer Confidence: {confidence_scores.get('synthesis_confidence', 0):.2f}\n"
-            
-            # Hypotheses
-            hypotheses = result.get("hypotheses", [])
-            if hypotheses:
-                intelligence_summary += "\n### Generated Hypotheses:\n"
-                for i, hyp in enumerate(hypotheses, 1):
-                    intelligence_summary += f"{i}. **{hyp['statement']}**\n"
-                    intelligence_summary += f"   - Type: {hyp['type']}\n"
-                    intelligence_summary += f"   - Confidence: {hyp['confidence']:.2f}\n\n"
-            
-            # Quality assessment
-            quality_assessment = result.get("quality_assessment", {})
-            quality_summary = "## Quality Assessment\n\n"
-            
-            if quality_assessment:
-                quality_summary += f"- **Overall Quality Score:** {quality_assessment.get('overall_quality_score', 'N/A')}/10\n"
-                quality_summary += f"- **Confidence Level:** {quality_assessment.get('confidence_assessment', 'N/A'):.2f}\n"
-                quality_summary += f"- **Total Findings:** {quality_assessment.get('total_findings', 0)}\n"
-                quality_summary += f"- **External Sources Used:** {quality_assessment.get('external_sources_used', 0)}\n"
-                quality_summary += f"- **Source Diversity:** {quality_assessment.get('source_diversity', 0)}\n"
-                
-                quality_indicators = quality_assessment.get("quality_indicators", {})
-                quality_summary += "\n### Quality Indicators:\n"
-                for indicator, status in quality_indicators.items():
-                    icon = "✅" if status else "❌"
-                    quality_summary += f"{icon} {indicator.replace('_', ' ').title()}\n"
-            
-            return final_answer, process_summary, intelligence_summary, quality_summary
+            # Shielded so one caller going away does not cancel the shared run
+            outputs = await asyncio.shield(task)
+            # For the caller that streamed the run, the last snapshot already is the result
+            if outputs != last_yielded:
+                yield outputs
             
         except Exception as e:
             error_msg = f"Research failed: {str(e)}"
-            return error_msg, "", "", ""
+            yield error_msg, "", "", ""
+    
+    async def _run_research(self, question: str, question_key: str,
+                            on_update: Callable[[Dict[str, Any]], None]) -> Tuple[str, str, str, str]:
+        """Run the research graph for a question and format the results"""
+        
+        # Prepare initial state
+        initial_state = {
+            "messages": [],
+            "research_question": question,
+            "research_plan": [],
+            "current_step": 0,
+            "findings": [],
+            "final_answer": "",
+            "iteration_count": 0,
+            "hypotheses": [],
+            "multi_agent_analysis": {},
+            "quality_assessment": {},
+            "intelligence_insights": {}
+        }
+        
+        # Execute research through the worker pool
+        result = await self._invoke_agent(initial_state, on_update)
+        outputs = _format_results(result)
+        
+        # Store in history
+        self.research_history.append(ResearchRecord(
+            question=question,
+            timestamp=datetime.now().isoformat(),
+            quality_score=result.get('quality_assessment', {}).get('overall_quality_score', 'N/A')
+        ))
+        
+        self._cache_answer(question_key, outputs)
+        return outputs
+    
+    async def _invoke_agent(self, initial_state: Dict[str, Any],
+                            on_update: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """Queue a graph run for the worker pool and wait for its final state"""
+        if self._research_queue is None:
+            # Started lazily because the queue and tasks need Gradio's running loop
+            self._research_queue = asyncio.Queue(maxsize=_RESEARCH_QUEUE_SIZE)
+            self._research_workers = [
+                asyncio.ensure_future(self._research_worker())
+                for _ in range(_RESEARCH_WORKERS)
+            ]
+        
+        future = asyncio.get_running_loop().create_future()
+        await self._research_queue.put((initial_state, on_update, future))
+        return await future
+    
+    async def _research_worker(self):
+        """Run queued research requests one at a time"""
+        while True:
+            initial_state, on_update, future = await self._research_queue.get()
+            try:
+                if not future.done():
+                    # The agent keeps per-run state, so each run gets a graph to itself
+                    agent = await _checkout_agent()
+                    try:
+                        # Stream full state snapshots so the UI can show each phase;
+                        # the last snapshot is the final result
+                        result = initial_state
+                        async for result in agent.astream(initial_state, stream_mode="values"):
+                            on_update(result)
+                    finally:
+                        _agent_pool.append(agent)
+                    if not future.done():
+                        future.set_result(result)
+            except Exception as e:
+                if not future.done():
+                    future.set_exception(e)
+            finally:
+                self._research_queue.task_done()
+    
+    def _get_cached_answer(self, question_key: str) -> Optional[Tuple[str, str, str, str]]:
+        """Return a fresh cached result for a normalized question, if any"""
+        entry = self._answer_cache.get(question_key)
+        if entry is None:
+            return None
+        
+        cached_at, outputs = entry
+        if time.monotonic() - cached_at >= _ANSWER_CACHE_TTL_SECONDS:
+            del self._answer_cache[question_key]
+            return None
+        
+        self._answer_cache.move_to_end(question_key)
+        return outputs
+    
+    def _cache_answer(self, question_key: str, outputs: Tuple[str, str, str, str]):
+        """Store a result, evicting the least recently used entry when full"""
+        self._answer_cache[question_key] = (time.monotonic(), outputs)
+        self._answer_cache.move_to_end(question_key)
+        if len(self._answer_cache) > _ANSWER_CACHE_SIZE:
+            self._answer_cache.popitem(last=False)
     
-    def get_research_suggestions(self) -> List[str]:
+    def get_research_suggestions(self) -> Tuple[str, ...]:
         """Get research question suggestions"""
-        return [
-            "What are the ethical implications of AI in healthcare?",
-            "How do different renewable energy technologies compare in efficiency?",
-            "What are the latest breakthroughs in quantum computing?",
-            "How does climate change affect global food security?",
-            "What are the emerging trends in cybersecurity?",
-            "How do different economic models predict inflation?",
-            "What are the competing theories about consciousness?",
-            "How does social media impact mental health?",
-            "What are the potential applications of CRISPR gene editing?",
-            "How do neural networks learn and make decisions?"
-        ]
+        return _SUGGESTIONS
     
     def get_memory_statistics(self) -> str:
-        """Get memory system statistics"""
+        """Get memory system statistics (cached briefly to absorb repeated clicks)"""
+        now = time.monotonic()
+        if self._stats_cache is not None and now - self._stats_cache[0] < _STATS_TTL_SECONDS:
+            return self._stats_cache[1]
+        
         try:
             stats = self.memory_manager.hierarchical_memory.get_memory_statistics()
             
@@ -161,6 +385,7 @@ class GradioResearchInterface:
             stats_text += f"- **Concepts Tracked:** {stats.get('concepts_tracked', 0)}\n"
             stats_text += f"- **Citations Tracked:** {stats.get('citations_tracked', 0)}\n"
             
+            self._stats_cache = (now, stats_text)
             return stats_text
             
         except Exception as e:
@@ -168,44 +393,38 @@ class GradioResearchInterface:
     
     def get_research_history(self) -> str:
         """Get research history summary"""
-        if not self.research_history:
+        # Runs on a worker thread while the event loop may append to the deque;
+        # list() copies it atomically, iterating it directly could raise
+        recent_research = list(self.research_history)[-5:]
+        if not recent_research:
             return "No research history available."
         
-        history_text = "## Recent Research History\n\n"
-        
-        for i, research in enumerate(self.research_history[-5:], 1):
-            history_text += f"### Research {i}\n"
-            history_text += f"- **Question:** {research['question']}\n"
-            history_text += f"- **Quality Score:** {research.get('quality_score', 'N/A')}\n"
-            history_text += f"- **Timestamp:** {research.get('timestamp', 'Unknown')}\n\n"
+        history_lines = ["## Recent Research History", ""]
+        history_lines += [
+            line
+            for i, research in enumerate(recent_research, 1)
+            for line in (
+                f"### Research {i}",
+                f"- **Question:** {research.question}",
+                f"- **Quality Score:** {research.quality_score}",
+                f"- **Timestamp:** {research.timestamp}",
+                ""
+            )
+        ]
         
-        return history_text
+        return "\n".join(history_lines) + "\n"
     
     def export_research_results(self, final_answer: str, process_summary: str, 
                                intelligence_summary: str, quality_summary: str) -> str:
         """Export research results as markdown"""
         
-        if not final_answer or final_answer.startswith("Please enter") or final_answer.startswith("Research failed"):
+        if not final_answer or final_answer.startswith(_NOT_EXPORTABLE_PREFIXES):
             return "No research results to export."
         
-        export_content = f"""# AI Research Agent - Research Report
-
-Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-## Final Answer
-
-{final_answer}
-
-{process_summary}
-
-{intelligence_summary}
-
-{quality_summary}
-
----
-
-*This report was generated by the AI Research Agent - Phase 5 User Experience*
-"""
+        export_content = _EXPORT_HEADER.substitute(
+            generated_on=datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+            final_answer=final_answer
+        ) + f"{process_summary}\n\n{intelligence_summary}\n\n{quality_summary}" + _EXPORT_FOOTER
         
         return export_content
     
@@ -344,12 +563,8 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
             
             # Event handlers
             def show_suggestions():
-                suggestions = self.get_research_suggestions()
-                suggestions_text = "## Research Question Suggestions\n\n"
-                for i, suggestion in enumerate(suggestions, 1):
-                    suggestions_text += f"{i}. {suggestion}\n"
                 return {
-                    suggestions_output: gr.update(value=suggestions_text, visible=True)
+                    suggestions_output: gr.update(value=_SUGGESTIONS_MD, visible=True)
                 }
             
             # Connect event handlers
@@ -385,6 +600,12 @@ Generated on: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
     def launch(self, share=False, debug=False):
         """Launch the Gradio interface"""
         interface = self.create_interface()
+        # Async handlers only overlap if Gradio lets several events run at once
+        interface.queue(
+            default_concurrency_limit=_EVENT_CONCURRENCY,
+            max_size=_EVENT_QUEUE_SIZE,
+            api_open=False
+        )
         interface.launch(
             share=share,
             debug=debug,
@@ -6,23 +6,377 @@ Provides interactive web interface with real-time progress tracking
 
 import streamlit as st
 import asyncio
+import hashlib
+import io
+import itertools
 import json
-import time
+import pickle
+import queue
+import re
+import shutil
+import tempfile
+import threading
+import weakref
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, Any, List
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Union
 
-# Import our research agent
+# Faster JSON serialization for previews and exports
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Make our research agent importable; plotting, pandas and agent modules
+# are imported where they are first used to keep cold start light
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from agent.research_agent import create_agent
-from memory.advanced_memory_manager import AdvancedMemoryManager
-from tools.research_tools_manager import get_research_tools_manager
+
+# Page styles, built once at import instead of on every rerun
+_CSS = """
+.main-header {
+    font-size: 3rem;
+    color: #1f77b4;
+    text-align: center;
+    margin-bottom: 2rem;
+}
+.research-card {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    margin: 1rem 0;
+}
+.progress-container {
+    background-color: #ffffff;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border: 1px solid #e0e0e0;
+}
+"""
+_CSS_BLOCK = f"<style>{_CSS}</style>"
+
+# Gap between the three visualization subplots, as a fraction of figure width
+_SUBPLOT_SPACING = 0.12
+
+# Example questions offered by the suggestions button
+_SUGGESTIONS = (
+    "What are the ethical implications of AI in healthcare?",
+    "How do different renewable energy technologies compare in efficiency?",
+    "What are the latest breakthroughs in quantum computing?",
+    "How does climate change affect global food security?",
+    "What are the emerging trends in cybersecurity?",
+    "How do different economic models predict inflation?",
+    "What are the competing theories about consciousness?",
+    "How does social media impact mental health?"
+)
+_SUGGESTIONS_MD = "💡 **Research Question Suggestions:**\n\n" + "\n".join(f"• {s}" for s in _SUGGESTIONS)
+
+_TOOL_GUIDE_MD = """
+🛠️ **Research Tools Available:**
+
+**Web Research:**
+• DuckDuckGo Search - Current information
+• Wikipedia - Background knowledge
+• arXiv - Academic papers
+• News Search - Latest developments
+
+**Document Processing:**
+• PDF Analysis - Extract and analyze documents
+• Structure Analysis - Organize content
+
+**Intelligence Layer:**
+• Multi-Agent Analysis - Multiple perspectives
+• Hypothesis Testing - Scientific validation
+• Quality Assessment - Credibility scoring
+"""
+
+# Background research threads, and how often the script polls them for progress
+_RESEARCH_WORKERS = 4
+_PROGRESS_POLL_SECONDS = 0.25
+
+# Event tag for final answer tokens streamed out of the synthesize node
+_ANSWER_TOKEN = "answer_token"
+
+# Event tag sent once a pool worker picks up the run
+_RUN_STARTED = "run_started"
+
+# Reports kept per format by the process-wide report caches
+_REPORT_CACHE_ENTRIES = 64
+
+# Key findings section of a step analysis, up to the new concepts section
+_KEY_FINDINGS_RE = re.compile(r"KEY_FINDINGS:(.*?)(?:NEW_CONCEPTS:|$)", re.S)
+
+# Research records kept in memory per session (older ones are spilled to
+# temp files), and how many the sidebar shows
+_HISTORY_LIMIT = 20
+_SIDEBAR_HISTORY_ITEMS = 5
+
+# Spilled records kept per session; the least recently used ones are deleted
+_ARCHIVE_LIMIT = 50
+
+# Quality assessment lines of the markdown report: key, label, unit suffix
+_QUALITY_REPORT_LINES = (
+    ('overall_quality_score', 'Overall Quality Score', '/10'),
+    ('confidence_assessment', 'Confidence Level', ''),
+    ('total_findings', 'Total Findings', ''),
+    ('external_sources_used', 'External Sources Used', '')
+)
+
+# Axes of the quality radar chart, in the order _radar_metrics returns them
+_RADAR_AXES = ('Completeness', 'Source Diversity', 'External Validation', 'Confidence', 'Overall Quality')
+
+# sources_used keys and their labels in the source distribution chart
+_SOURCE_LABELS = {
+    'memory_basic': 'Memory (Basic)',
+    'memory_advanced': 'Memory (Advanced)',
+    'external_sources': 'External Sources'
+}
+
+
+@st.cache_resource(show_spinner=False)
+def _agent_store() -> threading.local:
+    """Per-thread agent slots shared by all sessions"""
+    return threading.local()
+
+
+def _thread_agent():
+    """Return this worker thread's own research agent, building it on first use"""
+    # The agent keeps per-run state, so concurrent runs must not share one
+    store = _agent_store()
+    if not hasattr(store, "agent"):
+        from agent.research_agent import create_agent
+        store.agent = create_agent()
+    return store.agent
+
+
+@st.cache_resource(show_spinner=False)
+def _get_memory_manager() -> "AdvancedMemoryManager":
+    """Share one memory manager across all sessions"""
+    from memory.advanced_memory_manager import AdvancedMemoryManager
+    return AdvancedMemoryManager()
+
+
+@st.cache_resource(show_spinner=False)
+def _research_pool() -> ThreadPoolExecutor:
+    """Worker threads that run research graphs off the script thread"""
+    return ThreadPoolExecutor(max_workers=_RESEARCH_WORKERS, thread_name_prefix="research")
+
+
+def _stream_research(initial_state: Dict[str, Any], events: queue.Queue,
+                     cancelled: threading.Event) -> None:
+    """Run the research graph, forwarding node updates and answer tokens to events"""
+    # The session may have stopped while this run was still queued
+    if cancelled.is_set():
+        return
+    events.put((_RUN_STARTED, None))
+    agent = _thread_agent()
+    
+    async def _run():
+        async for mode, chunk in agent.astream(initial_state, stream_mode=["updates", "messages"]):
+            # Give the worker back as soon as nobody is reading the events
+            if cancelled.is_set():
+                break
+            if mode == "updates":
+                for node, update in chunk.items():
+                    events.put((node, update))
+            else:
+                # Only the synthesis LLM call produces the final answer
+                message, metadata = chunk
+                if metadata.get("langgraph_node") == "synthesize" and message.content:
+                    events.put((_ANSWER_TOKEN, message.content))
+    
+    asyncio.run(_run())
+
+
+def _drain_events(events: queue.Queue, future) -> Iterator[Tuple[str, Any]]:
+    """Yield graph events until the worker has finished and the queue is empty"""
+    while True:
+        try:
+            yield events.get(timeout=_PROGRESS_POLL_SECONDS)
+        except queue.Empty:
+            if future.done() and events.empty():
+                return
+
+
+# Kept out of session state: Streamlit redefines this class on every rerun, so
+# an instance from an earlier run cannot be pickled when its record is archived
+@dataclass(frozen=True)
+class ResultView:
+    """Headline figures of a research result, built once per results render"""
+    quality_assessment: Dict[str, Any]
+    quality_score: Union[float, str]
+    confidence: Union[float, str]
+    findings_count: int
+    hypotheses_count: int
+    final_answer: str
+
+
+def _result_view(result: Dict[str, Any]) -> ResultView:
+    """Extract the headline figures shown in the overview and the summary report"""
+    quality_assessment = result.get('quality_assessment') or {}
+    return ResultView(
+        quality_assessment=quality_assessment,
+        quality_score=quality_assessment.get('overall_quality_score', 'N/A'),
+        confidence=quality_assessment.get('confidence_assessment', 'N/A'),
+        findings_count=len(result.get('findings') or ()),
+        hypotheses_count=len(result.get('hypotheses') or ()),
+        final_answer=result.get('final_answer') or ''
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def _archive_root() -> tempfile.TemporaryDirectory:
+    """Process-wide directory for archived research, removed when the server exits"""
+    return tempfile.TemporaryDirectory(prefix="research_archive_")
+
+
+def _new_session_archive() -> Tuple[deque, str]:
+    """Create a session's archive stub list and the directory holding its files"""
+    archived = deque()
+    directory = tempfile.mkdtemp(dir=_archive_root().name)
+    # Delete the session's archived files once its session state is dropped
+    weakref.finalize(archived, shutil.rmtree, directory, True)
+    return archived, directory
+
+
+def _archive_record(record: Dict[str, Any], directory: str) -> Dict[str, Any]:
+    """Pickle a research record to a temp file, returning a small stub that points at it"""
+    fd, path = tempfile.mkstemp(prefix="research_", suffix=".pkl", dir=directory)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+    except BaseException:
+        # Don't leave a half-written file behind
+        _discard_archived({'path': path})
+        raise
+    return {'question': record['question'], 'timestamp': record.get('timestamp', 'Unknown'), 'path': path}
+
+
+def _discard_archived(stub: Dict[str, Any]) -> None:
+    """Delete the temp file behind an archived record stub"""
+    try:
+        os.unlink(stub['path'])
+    except OSError:
+        pass
+
+
+def _load_archived_record(stub: Dict[str, Any]) -> Dict[str, Any]:
+    """Re-hydrate a research record spilled by _archive_record"""
+    with open(stub['path'], "rb") as f:
+        return pickle.load(f)
+
+
+def _request_key(question: str, config: Dict[str, Any]) -> str:
+    """Digest identifying a research request by its question and sidebar settings"""
+    payload = json.dumps({'q': question, 'c': config}, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _result_key(result: Dict[str, Any]) -> str:
+    """Stable digest of a research result, used as the report cache key"""
+    if ORJSON_AVAILABLE:
+        payload = orjson.dumps(result, default=str,
+                               option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+    else:
+        payload = json.dumps(result, default=str, sort_keys=True).encode()
+    return hashlib.sha1(payload).hexdigest()
+
+
+@st.cache_data(show_spinner=False, max_entries=_REPORT_CACHE_ENTRIES)
+def _json_report(result_key: str, _result: Dict[str, Any]) -> str:
+    """Serialize a research result once per result digest"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(_result, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    return json.dumps(_result, indent=2, default=str)
+
+
+def _radar_metrics(total_findings: int, source_diversity: int, external_sources: int,
+                   confidence: float, overall_quality: float) -> Tuple[float, ...]:
+    """Scale quality assessment figures onto the 0-10 radar axes"""
+    return (
+        min(total_findings / 5 * 10, 10),
+        min(source_diversity / 4 * 10, 10),
+        external_sources / max(total_findings, 1) * 10,
+        confidence * 10,
+        overall_quality
+    )
+
+
+@st.cache_data(show_spinner=False, max_entries=_REPORT_CACHE_ENTRIES)
+def _markdown_report(result_key: str, question: str, _result: Dict[str, Any]) -> str:
+    """Build the markdown report body, memoized per result digest"""
+    report = io.StringIO()
+    write = report.write
+    
+    write(f"""# Research Report
+
+## Research Question
+{question}
+
+## Final Answer
+{_result.get('final_answer', 'No final answer generated')}
+
+## Research Process
+""")
+    
+    research_plan = _result.get('research_plan', [])
+    if research_plan:
+        write("\n### Research Plan\n")
+        for i, step in enumerate(research_plan, 1):
+            write(f"{i}. {step}\n")
+    
+    findings = _result.get('findings', [])
+    if findings:
+        write("\n### Key Findings\n")
+        for finding in findings:
+            write(f"\n#### Step {finding['step'] + 1}: {finding['step_description']}\n")
+            key_findings = _KEY_FINDINGS_RE.search(finding.get('analysis', ''))
+            if key_findings and (key_findings_text := key_findings.group(1).strip()):
+                write(f"{key_findings_text}\n")
+    
+    # Quality assessment; only the figures the assessment actually has
+    quality_assessment = _result.get('quality_assessment') or {}
+    if quality_assessment:
+        quality_lines = "".join(
+            f"- {label}: {value}{suffix}\n"
+            for key, label, suffix in _QUALITY_REPORT_LINES
+            if (value := quality_assessment.get(key)) is not None
+        )
+        write(f"\n## Quality Assessment\n{quality_lines}")
+    
+    return report.getvalue()
+
+
+def _stamp_report(body: str) -> str:
+    """Append the generation footer; kept out of the cached body so it stays current"""
+    return f"{body}\n---\n*Generated by AI Research Agent on {datetime.now():%Y-%m-%d %H:%M:%S}*\n"
+
+
+@st.cache_data(show_spinner=False, max_entries=_REPORT_CACHE_ENTRIES)
+def _summary_report(result_key: str, question: str, _view: ResultView) -> str:
+    """Build the summary report, memoized per result digest"""
+    preview = (_view.final_answer or 'No final answer')[:300]
+    
+    return "\n".join((
+        "**Research Summary**",
+        "",
+        f"**Question:** {question}",
+        "",
+        "**Key Metrics:**",
+        f"- Research Steps Completed: {_view.findings_count}",
+        f"- Quality Score: {_view.quality_score}/10",
+        f"- Hypotheses Generated: {_view.hypotheses_count}",
+        "",
+        "**Final Answer Preview:**",
+        f"{preview}..."
+    ))
+
 
 class StreamlitResearchInterface:
     """Streamlit interface for the research agent"""
@@ -40,47 +394,22 @@ class StreamlitResearchInterface:
             initial_sidebar_state="expanded"
         )
         
-        # Custom CSS
-        st.markdown("""
-        <style>
-        .main-header {
-            font-size: 3rem;
-            color: #1f77b4;
-            text-align: center;
-            margin-bottom: 2rem;
-        }
-        .research-card {
-            background-color: #f0f2f6;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            margin: 1rem 0;
-        }
-        .progress-container {
-            background-color: #ffffff;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            border: 1px solid #e0e0e0;
-        }
-        .metric-card {
-            background-color: #ffffff;
-            padding: 1rem;
-            border-radius: 0.5rem;
-            text-align: center;
-            box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }
-        </style>
-        """, unsafe_allow_html=True)
+        # Custom CSS; re-emitted on every rerun because Streamlit drops
+        # elements that a rerun does not write again
+        st.markdown(_CSS_BLOCK, unsafe_allow_html=True)
     
     def initialize_session_state(self):
         """Initialize Streamlit session state"""
         if 'research_history' not in st.session_state:
-            st.session_state.research_history = []
+            st.session_state.research_history = deque(maxlen=_HISTORY_LIMIT)
+        if 'archived_research' not in st.session_state:
+            st.session_state.archived_research, st.session_state.archive_dir = _new_session_archive()
         if 'current_research' not in st.session_state:
             st.session_state.current_research = None
         if 'research_progress' not in st.session_state:
             st.session_state.research_progress = {}
-        if 'memory_manager' not in st.session_state:
-            st.session_state.memory_manager = AdvancedMemoryManager()
+        if 'visualization_figure' not in st.session_state:
+            st.session_state.visualization_figure = None
     
     def render_header(self):
         """Render the main header"""
@@ -120,7 +449,7 @@ class StreamlitResearchInterface:
             # Memory statistics
             st.subheader("📊 Memory Statistics")
             try:
-                stats = st.session_state.memory_manager.hierarchical_memory.get_memory_statistics()
+                stats = _get_memory_manager().hierarchical_memory.get_memory_statistics()
                 
                 col1, col2 = st.columns(2)
                 with col1:
@@ -137,14 +466,7 @@ class StreamlitResearchInterface:
             
             # Research history
             st.subheader("📚 Recent Research")
-            if st.session_state.research_history:
-                for i, research in enumerate(st.session_state.research_history[-5:]):
-                    with st.expander(f"Research {len(st.session_state.research_history) - i}"):
-                        st.write(f"**Question:** {research['question'][:100]}...")
-                        st.write(f"**Quality Score:** {research.get('quality_score', 'N/A')}")
-                        st.write(f"**Date:** {research.get('timestamp', 'Unknown')}")
-            else:
-                st.info("No research history yet")
+            self.render_history()
             
             return {
                 'depth': research_depth,
@@ -153,6 +475,65 @@ class StreamlitResearchInterface:
                 'visualization': enable_visualization
             }
     
+    @st.fragment
+    def render_history(self):
+        """Render recent research; runs as a fragment so it reruns on its own"""
+        history = st.session_state.research_history
+        if history:
+            recent = itertools.islice(history, max(len(history) - _SIDEBAR_HISTORY_ITEMS, 0), None)
+            for i, research in enumerate(recent):
+                with st.expander(f"Research {len(history) - i}"):
+                    st.markdown(f"**Question:** {research['question'][:100]}...\n\n"
+                                f"**Quality Score:** {research.get('quality_score', 'N/A')}\n\n"
+                                f"**Date:** {research.get('timestamp', 'Unknown')}")
+        else:
+            st.info("No research history yet")
+        
+        # Records spilled out of the in-memory history load back on demand
+        archived = st.session_state.archived_research
+        if archived:
+            with st.expander(f"🗄️ Older Research ({len(archived)})"):
+                choice = st.selectbox(
+                    "Archived research",
+                    range(len(archived) - 1, -1, -1),
+                    format_func=lambda i: f"{archived[i]['timestamp'][:16]} · {archived[i]['question'][:60]}"
+                )
+                if st.button("Load older research", use_container_width=True):
+                    stub = archived[choice]
+                    del archived[choice]
+                    try:
+                        st.session_state.current_research = _load_archived_record(stub)
+                    except Exception as e:
+                        # Missing, truncated or stale pickle; drop it from the archive
+                        _discard_archived(stub)
+                        st.error(f"Could not load archived research: {e}")
+                    else:
+                        # Most recently used records are evicted last
+                        archived.append(stub)
+                        st.rerun()
+    
+    def find_research_record(self, request_key: str) -> Optional[Dict[str, Any]]:
+        """Return the most recent in-memory record made for the same request, if any"""
+        for research in reversed(st.session_state.research_history):
+            if research.get('request_key') == request_key:
+                return research
+        return None
+    
+    def store_research_record(self, research_record: Dict[str, Any]):
+        """Add a record to the bounded history, spilling the oldest one to disk"""
+        history = st.session_state.research_history
+        archived = st.session_state.archived_research
+        if len(history) == history.maxlen:
+            try:
+                archived.append(_archive_record(history[0], st.session_state.archive_dir))
+            except Exception as e:
+                st.warning(f"Could not archive older research: {e}")
+            
+            # Evict the least recently used archived records and their files
+            while len(archived) > _ARCHIVE_LIMIT:
+                _discard_archived(archived.popleft())
+        history.append(research_record)
+    
     def render_research_input(self):
         """Render the research input section"""
         st.header("🔍 Start New Research")
@@ -181,185 +562,147 @@ class StreamlitResearchInterface:
     
     def show_research_suggestions(self):
         """Show research question suggestions"""
-        suggestions = [
-            "What are the ethical implications of AI in healthcare?",
-            "How do different renewable energy technologies compare in efficiency?",
-            "What are the latest breakthroughs in quantum computing?",
-            "How does climate change affect global food security?",
-            "What are the emerging trends in cybersecurity?",
-            "How do different economic models predict inflation?",
-            "What are the competing theories about consciousness?",
-            "How does social media impact mental health?"
-        ]
-        
-        st.info("💡 **Research Question Suggestions:**\n\n" + "\n".join([f"• {s}" for s in suggestions]))
+        st.info(_SUGGESTIONS_MD)
     
     def show_tool_guide(self):
         """Show tool usage guide"""
-        st.info("""
-        🛠️ **Research Tools Available:**
-        
-        **Web Research:**
-        • DuckDuckGo Search - Current information
-        • Wikipedia - Background knowledge
-        • arXiv - Academic papers
-        • News Search - Latest developments
-        
-        **Document Processing:**
-        • PDF Analysis - Extract and analyze documents
-        • Structure Analysis - Organize content
-        
-        **Intelligence Layer:**
-        • Multi-Agent Analysis - Multiple perspectives
-        • Hypothesis Testing - Scientific validation
-        • Quality Assessment - Credibility scoring
-        """)
+        st.info(_TOOL_GUIDE_MD)
     
     def run_research_with_progress(self, question: str, config: Dict[str, Any]):
         """Run research with real-time progress tracking"""
+        st.header("🔄 Research Progress")
         
-        # Initialize progress tracking
-        progress_container = st.container()
-        status_container = st.container()
-        
-        with progress_container:
-            st.header("🔄 Research Progress")
-            
-            # Progress bars
-            overall_progress = st.progress(0)
-            current_step_progress = st.progress(0)
-            
-            # Status indicators
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                planning_status = st.empty()
-            with col2:
-                research_status = st.empty()
-            with col3:
-                intelligence_status = st.empty()
-            with col4:
-                synthesis_status = st.empty()
+        # One status container carries every progress update
+        with st.status("⏳ Waiting for a free research worker...", expanded=True) as status:
+            try:
+                # Initialize state
+                initial_state = {
+                    "messages": [],
+                    "research_question": question,
+                    "research_plan": [],
+                    "current_step": 0,
+                    "findings": [],
+                    "final_answer": "",
+                    "iteration_count": 0,
+                    "hypotheses": [],
+                    "multi_agent_analysis": {},
+                    "quality_assessment": {},
+                    "intelligence_insights": {}
+                }
+                
+                # Run research with progress updates
+                result = self.execute_research_with_updates(initial_state, status)
+                
+                status.update(label="✅ Research completed successfully!", state="complete", expanded=False)
+                return result
+                
+            except Exception as e:
+                status.update(label="❌ Research failed", state="error")
+                st.error(f"Research failed: {str(e)}")
+                return None
+    
+    def execute_research_with_updates(self, initial_state, status):
+        """Execute research, updating progress as each graph node completes"""
+        # The graph runs on a pool thread; this script thread only drains its events
+        events = queue.Queue()
+        cancelled = threading.Event()
+        future = _research_pool().submit(_stream_research, initial_state, events, cancelled)
         
-        with status_container:
-            status_text = st.empty()
-            current_step_text = st.empty()
+        # Nodes return the whole state, so merging each update rebuilds the result
+        result = dict(initial_state)
+        stream = _drain_events(events, future)
         
         try:
-            # Create agent
-            agent = create_agent()
-            
-            # Initialize state
-            initial_state = {
-                "messages": [],
-                "research_question": question,
-                "research_plan": [],
-                "current_step": 0,
-                "findings": [],
-                "final_answer": "",
-                "iteration_count": 0,
-                "hypotheses": [],
-                "multi_agent_analysis": {},
-                "quality_assessment": {},
-                "intelligence_insights": {}
-            }
-            
-            # Update progress - Planning
-            planning_status.success("📋 Planning")
-            status_text.info("🧠 Creating research plan...")
-            overall_progress.progress(0.1)
-            
-            # Run research with progress updates
-            result = self.execute_research_with_updates(
-                agent, initial_state, 
-                overall_progress, current_step_progress,
-                status_text, current_step_text,
-                research_status, intelligence_status, synthesis_status
-            )
-            
-            # Final progress update
-            overall_progress.progress(1.0)
-            current_step_progress.progress(1.0)
-            status_text.success("✅ Research completed successfully!")
-            
-            # Update status indicators
-            planning_status.success("✅ Planning")
-            research_status.success("✅ Research")
-            intelligence_status.success("✅ Intelligence")
-            synthesis_status.success("✅ Synthesis")
-            
-            return result
+            for node, update in stream:
+                if node == _RUN_STARTED:
+                    status.update(label="📋 Creating research plan...")
+                    continue
+                if node != _ANSWER_TOKEN:
+                    result.update(update)
+                    self.show_node_progress(node, result, status)
+                    continue
+                
+                # Write the answer as it is generated, until the next node update arrives
+                following = []
+                
+                def _answer_tokens(token=update):
+                    yield token
+                    for next_node, next_update in stream:
+                        if next_node != _ANSWER_TOKEN:
+                            following.append((next_node, next_update))
+                            return
+                        yield next_update
+                
+                status.write_stream(_answer_tokens())
+                for next_node, next_update in following:
+                    result.update(next_update)
+                    self.show_node_progress(next_node, result, status)
             
-        except Exception as e:
-            st.error(f"Research failed: {str(e)}")
-            return None
+            # Re-raise anything the graph raised on the worker thread
+            future.result()
+        finally:
+            # Stop and reruns abort this thread, not the worker; tell it to quit
+            if not future.done():
+                cancelled.set()
+        return result
     
-    def execute_research_with_updates(self, agent, initial_state, 
-                                    overall_progress, step_progress,
-                                    status_text, step_text,
-                                    research_status, intelligence_status, synthesis_status):
-        """Execute research with real-time updates"""
-        
-        # This is a simplified version - in a real implementation,
-        # you'd need to modify the agent to provide progress callbacks
-        
-        status_text.info("🔍 Executing research steps...")
-        overall_progress.progress(0.3)
-        research_status.warning("🔄 Research")
-        
-        # Simulate research execution with progress
-        for i in range(3):
-            step_text.info(f"Step {i+1}: Analyzing research question...")
-            step_progress.progress((i+1)/3)
-            time.sleep(1)  # Simulate processing time
-        
-        # Intelligence analysis
-        status_text.info("🧠 Running intelligence analysis...")
-        overall_progress.progress(0.7)
-        intelligence_status.warning("🔄 Intelligence")
-        time.sleep(2)
-        
-        # Synthesis
-        status_text.info("🎯 Synthesizing final answer...")
-        overall_progress.progress(0.9)
-        synthesis_status.warning("🔄 Synthesis")
-        time.sleep(1)
-        
-        # Execute the actual research
-        result = agent.invoke(initial_state)
+    def show_node_progress(self, node: str, result: Dict[str, Any], status):
+        """Report a completed graph node in the research status block"""
+        if node == "plan":
+            status.write(f"✅ Planning: {len(result.get('research_plan', []))} research steps")
+            status.update(label="🔍 Executing research steps...")
+        
+        elif node == "research":
+            research_plan = result.get("research_plan", [])
+            total_steps = max(len(research_plan), 1)
+            completed_steps = min(result.get("current_step", 0), total_steps)
+            if research_plan and completed_steps:
+                status.write(f"Step {completed_steps}/{total_steps}: {research_plan[completed_steps - 1]}")
+            
+            if completed_steps >= total_steps:
+                status.write("✅ Research steps complete")
+                status.update(label="🧠 Running intelligence analysis...")
+            else:
+                status.update(label=f"🔍 Executing research steps ({completed_steps}/{total_steps})...")
         
-        return result
+        elif node == "intelligence":
+            status.write("✅ Intelligence analysis complete")
+            status.update(label="🎯 Synthesizing final answer...")
     
-    def render_research_results(self, result: Dict[str, Any], question: str):
-        """Render comprehensive research results"""
+    @st.fragment
+    def render_research_results(self, result: Dict[str, Any], question: str,
+                                result_key: Optional[str] = None, view: Optional[ResultView] = None):
+        """Render comprehensive research results as a fragment, so its own widgets rerun only the results"""
         
         st.header("📊 Research Results")
         
+        # Look up each result section once and hand it to the tab renderers
+        view = view or _result_view(result)
+        findings = result.get("findings") or []
+        quality_assessment = view.quality_assessment
+        hypotheses = result.get("hypotheses") or []
+        multi_agent_analysis = result.get("multi_agent_analysis") or {}
+        
         # Research overview
         col1, col2, col3, col4 = st.columns(4)
         
         with col1:
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Research Steps", len(result.get("findings", [])))
-            st.markdown('</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.metric("Research Steps", view.findings_count)
         
         with col2:
-            quality_score = result.get("quality_assessment", {}).get("overall_quality_score", "N/A")
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Quality Score", f"{quality_score}/10" if quality_score != "N/A" else "N/A")
-            st.markdown('</div>', unsafe_allow_html=True)
+            quality_score = view.quality_score
+            with st.container(border=True):
+                st.metric("Quality Score", f"{quality_score}/10" if quality_score != "N/A" else "N/A")
         
         with col3:
-            hypotheses_count = len(result.get("hypotheses", []))
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Hypotheses", hypotheses_count)
-            st.markdown('</div>', unsafe_allow_html=True)
+            with st.container(border=True):
+                st.metric("Hypotheses", view.hypotheses_count)
         
         with col4:
-            confidence = result.get("quality_assessment", {}).get("confidence_assessment", "N/A")
-            st.markdown('<div class="metric-card">', unsafe_allow_html=True)
-            st.metric("Confidence", f"{confidence:.2f}" if confidence != "N/A" else "N/A")
-            st.markdown('</div>', unsafe_allow_html=True)
+            confidence = view.confidence
+            with st.container(border=True):
+                st.metric("Confidence", f"{confidence:.2f}" if confidence != "N/A" else "N/A")
         
         # Tabs for different result sections
         tab1, tab2, tab3, tab4, tab5 = st.tabs([
@@ -371,33 +714,30 @@ class StreamlitResearchInterface:
         ])
         
         with tab1:
-            self.render_final_answer(result)
+            self.render_final_answer(result.get("final_answer", "No final answer generated"), quality_assessment)
         
         with tab2:
-            self.render_research_process(result)
+            self.render_research_process(result.get("research_plan") or [], findings)
         
         with tab3:
-            self.render_intelligence_analysis(result)
+            self.render_intelligence_analysis(multi_agent_analysis, hypotheses)
         
         with tab4:
-            self.render_visualizations(result, question)
+            self.render_visualizations(result, question, result_key)
         
         with tab5:
-            self.render_export_options(result, question)
+            self.render_export_options(result, question, result_key, view)
     
-    def render_final_answer(self, result: Dict[str, Any]):
+    def render_final_answer(self, final_answer: str, quality_assessment: Dict[str, Any]):
         """Render the final answer section"""
         st.subheader("🎯 Final Answer")
         
-        final_answer = result.get("final_answer", "No final answer generated")
-        
         # Display final answer in a nice format
         st.markdown('<div class="research-card">', unsafe_allow_html=True)
         st.markdown(final_answer)
         st.markdown('</div>', unsafe_allow_html=True)
         
         # Answer quality indicators
-        quality_assessment = result.get("quality_assessment", {})
         if quality_assessment:
             st.subheader("📊 Answer Quality Assessment")
             
@@ -416,12 +756,11 @@ class StreamlitResearchInterface:
                 st.write(f"• External Sources: {quality_assessment.get('external_sources_used', 0)}")
                 st.write(f"• Source Diversity: {quality_assessment.get('source_diversity', 0)}")
     
-    def render_research_process(self, result: Dict[str, Any]):
+    def render_research_process(self, research_plan: List[str], findings: List[Dict[str, Any]]):
         """Render the research process section"""
         st.subheader("🔍 Research Process")
         
         # Research plan
-        research_plan = result.get("research_plan", [])
         if research_plan:
             st.write("**Research Plan:**")
             for i, step in enumerate(research_plan, 1):
@@ -430,7 +769,6 @@ class StreamlitResearchInterface:
         st.divider()
         
         # Research findings
-        findings = result.get("findings", [])
         if findings:
             st.write("**Research Findings:**")
             
@@ -438,11 +776,10 @@ class StreamlitResearchInterface:
                 with st.expander(f"Step {finding['step'] + 1}: {finding['step_description']}"):
                     
                     # Analysis
-                    analysis = finding.get("analysis", "")
-                    if "KEY_FINDINGS:" in analysis:
-                        key_findings = analysis.split("KEY_FINDINGS:")[1].split("NEW_CONCEPTS:")[0].strip()
+                    key_findings = _KEY_FINDINGS_RE.search(finding.get("analysis", ""))
+                    if key_findings:
                         st.write("**Key Findings:**")
-                        st.write(key_findings)
+                        st.write(key_findings.group(1).strip())
                     
                     # Sources used
                     sources_used = finding.get("sources_used", {})
@@ -463,12 +800,12 @@ class StreamlitResearchInterface:
                         for research in external_research[:2]:
                             st.write(f"• {research[:100]}...")
     
-    def render_intelligence_analysis(self, result: Dict[str, Any]):
+    def render_intelligence_analysis(self, multi_agent_analysis: Dict[str, Any],
+                                     hypotheses: List[Dict[str, Any]]):
         """Render the intelligence analysis section"""
         st.subheader("🧠 Intelligence Layer Analysis")
         
         # Multi-agent analysis
-        multi_agent_analysis = result.get("multi_agent_analysis", {})
         if multi_agent_analysis:
             st.write("**Multi-Agent Collaboration:**")
             
@@ -498,7 +835,6 @@ class StreamlitResearchInterface:
         st.divider()
         
         # Hypotheses
-        hypotheses = result.get("hypotheses", [])
         if hypotheses:
             st.write("**Generated Hypotheses:**")
             
@@ -517,151 +853,147 @@ class StreamlitResearchInterface:
                         for prediction in hypothesis['predictions'][:3]:
                             st.write(f"• {prediction}")
     
-    def render_visualizations(self, result: Dict[str, Any], question: str):
+    def render_visualizations(self, result: Dict[str, Any], question: str,
+                              result_key: Optional[str] = None):
         """Render visualizations section"""
         st.subheader("📊 Research Visualizations")
         
-        # Research process timeline
-        self.create_research_timeline(result)
+        findings = result.get("findings") or []
+        quality_assessment = result.get("quality_assessment") or {}
+        if not findings:
+            st.info("No research steps or source data to visualize")
+        if not quality_assessment:
+            st.info("No quality assessment data available")
+        if not (findings or quality_assessment):
+            return
         
-        st.divider()
+        # Reruns for the same result re-emit the figure built last time
+        cached = st.session_state.visualization_figure
+        if result_key and cached and cached[0] == result_key:
+            fig = cached[1]
+        else:
+            fig = self.build_visualization_figure(findings, quality_assessment)
+            st.session_state.visualization_figure = (result_key, fig)
         
-        # Quality assessment radar chart
-        self.create_quality_radar_chart(result)
+        st.plotly_chart(fig, use_container_width=True)
+    
+    def build_visualization_figure(self, findings: List[Dict[str, Any]],
+                                   quality_assessment: Dict[str, Any]) -> "go.Figure":
+        """Build the combined timeline, radar and source figure"""
+        from plotly.subplots import make_subplots
+        
+        traces = (
+            self.create_research_timeline(findings),
+            self.create_quality_radar_chart(quality_assessment),
+            self.create_source_distribution_chart(findings)
+        )
         
-        st.divider()
+        # Timeline, quality radar and source distribution share one figure
+        fig = make_subplots(
+            rows=1, cols=3,
+            specs=[[{"type": "xy"}, {"type": "polar"}, {"type": "domain"}]],
+            subplot_titles=("Research Process Timeline",
+                            "Research Quality Radar Chart",
+                            "Source Usage Distribution"),
+            horizontal_spacing=_SUBPLOT_SPACING
+        )
         
-        # Source distribution
-        self.create_source_distribution_chart(result)
-    
-    def create_research_timeline(self, result: Dict[str, Any]):
-        """Create research process timeline"""
-        st.write("**Research Process Timeline**")
+        for col, trace in enumerate(traces, 1):
+            if trace is not None:
+                fig.add_trace(trace, row=1, col=col)
         
-        findings = result.get("findings", [])
-        if not findings:
-            st.info("No research steps to visualize")
-            return
+        fig.update_xaxes(title_text="Research Step", row=1, col=1)
+        fig.update_yaxes(showticklabels=False, showgrid=False, row=1, col=1)
+        fig.update_polars(radialaxis=dict(visible=True, range=[0, 10]))
+        fig.update_layout(height=450, showlegend=False)
         
-        # Create timeline data
-        timeline_data = []
-        for finding in findings:
-            timeline_data.append({
-                'step': finding['step'] + 1,
-                'description': finding['step_description'],
-                'sources': finding.get('sources_used', {}).get('external_sources', 0)
-            })
+        return fig
+    
+    def create_research_timeline(self, findings: List[Dict[str, Any]]) -> Optional["go.Scattergl"]:
+        """Create research process timeline trace"""
+        import numpy as np
+        import plotly.graph_objects as go
         
-        # Create timeline chart
-        fig = go.Figure()
+        if not findings:
+            return None
         
-        steps = [item['step'] for item in timeline_data]
-        descriptions = [item['description'][:50] + "..." for item in timeline_data]
-        sources = [item['sources'] for item in timeline_data]
+        # Timeline points, one per research step, built straight from the findings
+        count = len(findings)
+        steps = np.fromiter((finding['step'] for finding in findings), dtype=np.int32, count=count) + 1
+        descriptions = [finding['step_description'][:50] + "..." for finding in findings]
+        sources = np.fromiter(
+            (finding.get('sources_used', {}).get('external_sources', 0) for finding in findings),
+            dtype=np.int32, count=count
+        )
         
-        fig.add_trace(go.Scatter(
+        # Color bar sits in the gap between the timeline and the radar chart
+        return go.Scattergl(
             x=steps,
-            y=[1] * len(steps),
+            y=np.ones(count),
             mode='markers+text',
             marker=dict(
-                size=[20 + s*10 for s in sources],
+                size=20 + sources * 10,
                 color=sources,
                 colorscale='Blues',
                 showscale=True,
-                colorbar=dict(title="External Sources")
+                colorbar=dict(title="External Sources", x=(1 - 2 * _SUBPLOT_SPACING) / 3,
+                              xanchor="left", thickness=12)
             ),
             text=descriptions,
             textposition="top center",
             name="Research Steps"
-        ))
-        
-        fig.update_layout(
-            title="Research Process Timeline",
-            xaxis_title="Research Step",
-            yaxis=dict(showticklabels=False, showgrid=False),
-            height=400
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
     
-    def create_quality_radar_chart(self, result: Dict[str, Any]):
-        """Create quality assessment radar chart"""
-        st.write("**Research Quality Assessment**")
+    def create_quality_radar_chart(self, quality_assessment: Dict[str, Any]) -> Optional["go.Scatterpolar"]:
+        """Create quality assessment radar trace"""
+        import plotly.graph_objects as go
         
-        quality_assessment = result.get("quality_assessment", {})
         if not quality_assessment:
-            st.info("No quality assessment data available")
-            return
+            return None
         
         # Quality metrics
-        metrics = {
-            'Completeness': min(quality_assessment.get('total_findings', 0) / 5 * 10, 10),
-            'Source Diversity': min(quality_assessment.get('source_diversity', 0) / 4 * 10, 10),
-            'External Validation': quality_assessment.get('external_sources_used', 0) / max(quality_assessment.get('total_findings', 1), 1) * 10,
-            'Confidence': quality_assessment.get('confidence_assessment', 0) * 10,
-            'Overall Quality': quality_assessment.get('overall_quality_score', 0)
-        }
-        
-        # Create radar chart
-        fig = go.Figure()
-        
-        fig.add_trace(go.Scatterpolar(
-            r=list(metrics.values()),
-            theta=list(metrics.keys()),
+        metrics = _radar_metrics(
+            quality_assessment.get('total_findings', 0),
+            quality_assessment.get('source_diversity', 0),
+            quality_assessment.get('external_sources_used', 0),
+            quality_assessment.get('confidence_assessment', 0) or 0,
+            quality_assessment.get('overall_quality_score', 0) or 0
+        )
+        
+        return go.Scatterpolar(
+            r=metrics,
+            theta=_RADAR_AXES,
             fill='toself',
             name='Quality Metrics'
-        ))
-        
-        fig.update_layout(
-            polar=dict(
-                radialaxis=dict(
-                    visible=True,
-                    range=[0, 10]
-                )),
-            showlegend=True,
-            title="Research Quality Radar Chart"
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
     
-    def create_source_distribution_chart(self, result: Dict[str, Any]):
-        """Create source distribution chart"""
-        st.write("**Source Distribution**")
+    def create_source_distribution_chart(self, findings: List[Dict[str, Any]]) -> Optional["go.Pie"]:
+        """Create source distribution trace"""
+        import pandas as pd
+        import plotly.graph_objects as go
         
-        findings = result.get("findings", [])
         if not findings:
-            st.info("No source data available")
-            return
-        
-        # Aggregate source usage
-        source_totals = {
-            'Memory (Basic)': 0,
-            'Memory (Advanced)': 0,
-            'External Sources': 0
-        }
+            return None
         
-        for finding in findings:
-            sources_used = finding.get("sources_used", {})
-            source_totals['Memory (Basic)'] += sources_used.get('memory_basic', 0)
-            source_totals['Memory (Advanced)'] += sources_used.get('memory_advanced', 0)
-            source_totals['External Sources'] += sources_used.get('external_sources', 0)
-        
-        # Create pie chart
-        fig = go.Figure(data=[go.Pie(
-            labels=list(source_totals.keys()),
-            values=list(source_totals.values()),
-            hole=.3
-        )])
-        
-        fig.update_layout(
-            title="Source Usage Distribution",
-            annotations=[dict(text='Sources', x=0.5, y=0.5, font_size=20, showarrow=False)]
+        # Aggregate source usage in one columnar reduction
+        source_usage = pd.DataFrame.from_records([finding.get("sources_used", {}) for finding in findings])
+        source_totals = source_usage.reindex(columns=list(_SOURCE_LABELS), fill_value=0).sum()
+        
+        # The combined figure hides legends, so slices carry their own labels
+        return go.Pie(
+            labels=list(_SOURCE_LABELS.values()),
+            values=source_totals.values,
+            hole=.3,
+            textinfo='label+percent',
+            title=dict(text='Sources', position='middle center'),
+            name='Sources'
         )
-        
-        st.plotly_chart(fig, use_container_width=True)
     
-    def render_export_options(self, result: Dict[str, Any], question: str):
+    def render_export_options(self, result: Dict[str, Any], question: str,
+                              result_key: Optional[str] = None, view: Optional[ResultView] = None):
         """Render export options"""
+        result_key = result_key or _result_key(result)
+        
         st.subheader("📋 Export Research Results")
         
         col1, col2, col3 = st.columns(3)
@@ -672,11 +1004,11 @@ class StreamlitResearchInterface:
         
         with col2:
             if st.button("📊 Export as JSON", use_container_width=True):
-                self.export_as_json(result, question)
+                self.export_as_json(result, question, result_key)
         
         with col3:
             if st.button("📝 Export as Markdown", use_container_width=True):
-                self.export_as_markdown(result, question)
+                self.export_as_markdown(result, question, result_key)
         
         # Export preview
         st.subheader("📋 Export Preview")
@@ -684,24 +1016,25 @@ class StreamlitResearchInterface:
         export_format = st.selectbox("Preview Format", ["Markdown", "JSON", "Summary"])
         
         if export_format == "Markdown":
-            markdown_content = self.generate_markdown_report(result, question)
+            markdown_content = self.generate_markdown_report(result, question, result_key)
             st.code(markdown_content, language="markdown")
         
         elif export_format == "JSON":
-            json_content = json.dumps(result, indent=2, default=str)
+            json_content = _json_report(result_key, result)
             st.code(json_content, language="json")
         
         elif export_format == "Summary":
-            summary = self.generate_summary_report(result, question)
+            summary = self.generate_summary_report(result, question, result_key, view)
             st.markdown(summary)
     
     def export_as_pdf(self, result: Dict[str, Any], question: str):
         """Export research results as PDF"""
         st.info("PDF export functionality would be implemented here using reportlab")
     
-    def export_as_json(self, result: Dict[str, Any], question: str):
+    def export_as_json(self, result: Dict[str, Any], question: str,
+                       result_key: Optional[str] = None):
         """Export research results as JSON"""
-        json_str = json.dumps(result, indent=2, default=str)
+        json_str = _json_report(result_key or _result_key(result), result)
         st.download_button(
             label="Download JSON",
             data=json_str,
@@ -709,9 +1042,10 @@ class StreamlitResearchInterface:
             mime="application/json"
         )
     
-    def export_as_markdown(self, result: Dict[str, Any], question: str):
+    def export_as_markdown(self, result: Dict[str, Any], question: str,
+                           result_key: Optional[str] = None):
         """Export research results as Markdown"""
-        markdown_content = self.generate_markdown_report(result, question)
+        markdown_content = _stamp_report(self.generate_markdown_report(result, question, result_key))
         st.download_button(
             label="Download Markdown",
             data=markdown_content,
@@ -719,69 +1053,15 @@ class StreamlitResearchInterface:
             mime="text/markdown"
         )
     
-    def generate_markdown_report(self, result: Dict[str, Any], question: str) -> str:
-        """Generate markdown report"""
-        report = f"""# Research Report
-
-## Research Question
-{question}
-
-## Final Answer
-{result.get('final_answer', 'No final answer generated')}
-
-## Research Process
-"""
-        
-        research_plan = result.get('research_plan', [])
-        if research_plan:
-            report += "\n### Research Plan\n"
-            for i, step in enumerate(research_plan, 1):
-                report += f"{i}. {step}\n"
-        
-        findings = result.get('findings', [])
-        if findings:
-            report += "\n### Key Findings\n"
-            for finding in findings:
-                report += f"\n#### Step {finding['step'] + 1}: {finding['step_description']}\n"
-                analysis = finding.get('analysis', '')
-                if 'KEY_FINDINGS:' in analysis:
-                    key_findings = analysis.split('KEY_FINDINGS:')[1].split('NEW_CONCEPTS:')[0].strip()
-                    report += f"{key_findings}\n"
-        
-        # Quality assessment
-        quality_assessment = result.get('quality_assessment', {})
-        if quality_assessment:
-            report += f"\n## Quality Assessment\n"
-            report += f"- Overall Quality Score: {quality_assessment.get('overall_quality_score', 'N/A')}/10\n"
-            report += f"- Confidence Level: {quality_assessment.get('confidence_assessment', 'N/A')}\n"
-            report += f"- Total Findings: {quality_assessment.get('total_findings', 0)}\n"
-            report += f"- External Sources Used: {quality_assessment.get('external_sources_used', 0)}\n"
-        
-        report += f"\n---\n*Generated by AI Research Agent on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*\n"
-        
-        return report
+    def generate_markdown_report(self, result: Dict[str, Any], question: str,
+                                 result_key: Optional[str] = None) -> str:
+        """Generate markdown report body; downloads add the timestamp footer"""
+        return _markdown_report(result_key or _result_key(result), question, result)
     
-    def generate_summary_report(self, result: Dict[str, Any], question: str) -> str:
+    def generate_summary_report(self, result: Dict[str, Any], question: str,
+                                result_key: Optional[str] = None, view: Optional[ResultView] = None) -> str:
         """Generate summary report"""
-        quality_score = result.get('quality_assessment', {}).get('overall_quality_score', 'N/A')
-        findings_count = len(result.get('findings', []))
-        hypotheses_count = len(result.get('hypotheses', []))
-        
-        summary = f"""
-        **Research Summary**
-        
-        **Question:** {question}
-        
-        **Key Metrics:**
-        - Research Steps Completed: {findings_count}
-        - Quality Score: {quality_score}/10
-        - Hypotheses Generated: {hypotheses_count}
-        
-        **Final Answer Preview:**
-        {result.get('final_answer', 'No final answer')[:300]}...
-        """
-        
-        return summary
+        return _summary_report(result_key or _result_key(result), question, view or _result_view(result))
     
     def run(self):
         """Main application runner"""
@@ -796,28 +1076,41 @@ class StreamlitResearchInterface:
         
         # Handle research execution
         if start_research and research_question.strip():
-            with st.spinner("Initializing research agent..."):
-                result = self.run_research_with_progress(research_question, config)
+            request_key = _request_key(research_question, config)
+            previous_record = self.find_research_record(request_key)
             
-            if result:
-                # Store in session state
-                research_record = {
-                    'question': research_question,
-                    'result': result,
-                    'timestamp': datetime.now().isoformat(),
-                    'quality_score': result.get('quality_assessment', {}).get('overall_quality_score', 'N/A')
-                }
-                st.session_state.research_history.append(research_record)
-                st.session_state.current_research = research_record
+            if previous_record:
+                # Same question and settings as a stored run; show it instead of researching again
+                st.info("Showing stored results for this question and configuration")
+                st.session_state.current_research = previous_record
+                self.render_research_results(previous_record['result'], previous_record['question'],
+                                             previous_record.get('result_key'))
+            else:
+                with st.spinner("Initializing research agent..."):
+                    result = self.run_research_with_progress(research_question, config)
                 
-                # Render results
-                self.render_research_results(result, research_question)
+                if result:
+                    # Store in session state
+                    view = _result_view(result)
+                    research_record = {
+                        'question': research_question,
+                        'result': result,
+                        'result_key': _result_key(result),
+                        'request_key': request_key,
+                        'timestamp': datetime.now().isoformat(),
+                        'quality_score': view.quality_score
+                    }
+                    self.store_research_record(research_record)
+                    st.session_state.current_research = research_record
+                    
+                    # Render results
+                    self.render_research_results(result, research_question, research_record['result_key'], view)
         
         # Show current research if available
         elif st.session_state.current_research:
             st.header("📊 Current Research Results")
             current = st.session_state.current_research
-            self.render_research_results(current['result'], current['question'])
+            self.render_research_results(current['result'], current['question'], current.get('result_key'))
 
 def main():
     """Main function to run the Streamlit app"""